@@ -1,3 +1,4 @@
+import os
 import typer
 from pathlib import Path
 from .core import Config, ConfigError, GitRepo, GitError, FileProcessor, Messages
@@ -7,6 +8,11 @@ app = typer.Typer(help="资产交付器", no_args_is_help=True)
 SEPARATOR = "=" * 60
 
 
+def _inbox_entries(inbox: Path) -> list[os.DirEntry]:
+    with os.scandir(inbox) as it:
+        return [e for e in it if e.is_file()]
+
+
 @app.command()
 def init(
     git_url: str = typer.Option(..., prompt="Git仓库URL"),
@@ -85,14 +91,15 @@ def setup(config_file: Path):
 @app.command()
 def process(
     config_file: Path = typer.Argument(..., help="配置文件路径"),
-    files: list[Path] = typer.Option(None, "--file", "-f", help="指定文件")
+    files: list[Path] = typer.Option(None, "--file", "-f", help="指定文件"),
+    quiet: bool = typer.Option(False, "--quiet", "-q", help="只输出错误和汇总")
 ):
     """处理并提交文件"""
     try:
         config = Config.load(config_file)
         m = config.messages
         
-        file_list = files if files else [f for f in config.inbox.iterdir() if f.is_file()]
+        file_list = files if files else [Path(e.path) for e in _inbox_entries(config.inbox)]
         
         if not file_list:
             print(m.t('status.empty'))
@@ -102,7 +109,7 @@ def process(
         print(m.t('process.found_files', count=len(file_list)))
         print()
         
-        processor = FileProcessor(config)
+        processor = FileProcessor(config, quiet=quiet)
         success, failed = processor.process_batch(file_list)
         
         print()
@@ -134,7 +141,7 @@ def delete(
         m = config.messages
         repo = GitRepo(config.repo, m, config.git_token)
         
-        matches = list(config.repo.rglob(pattern))
+        matches = repo.ls_files(pattern)
         
         if not matches:
             print(m.t('delete.not_found', pattern=pattern))
@@ -149,9 +156,7 @@ def delete(
             print(m.t('delete.cancelled'))
             return
         
-        for match in matches:
-            match.unlink()
-            repo.remove(match)
+        repo.remove_many(matches)
         
         repo.commit(f"Delete: {pattern}")
         repo.push()
@@ -171,7 +176,7 @@ def status(config_file: Path = typer.Argument(..., help="配置文件路径")):
         config = Config.load(config_file)
         m = config.messages
         
-        files = [f for f in config.inbox.iterdir() if f.is_file()]
+        files = _inbox_entries(config.inbox)
         
         print(m.t('setup.inbox_dir', path=config.inbox))
         print()
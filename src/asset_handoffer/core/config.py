@@ -1,9 +1,22 @@
+from functools import cached_property
 from pathlib import Path
+import re
 import yaml
 from typing import Any
 from .exceptions import ConfigError
 from .i18n import Messages
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+_TEMPLATE_PLACEHOLDERS = re.compile(
+    r'(asset_root|repository): "(?:Assets/GameRes/|https://your-git-host\.com/your-org/your-project\.git)"'
+)
+
+_GIT_REPO_NAME = re.compile(r'([^/:]+?)(?:\.git)?/*$')
+
 
 class Config:
     def __init__(self, config_dict: dict, config_file: Path, messages: Messages = None):
@@ -32,13 +45,13 @@ class Config:
         self.failed = root / failed_name
     
     def _validate(self):
-        has_rules = self._get_nested('naming.rules')
-        has_pattern = self._get_nested('naming.pattern')
+        has_rules = self._get_nested('naming', 'rules')
+        has_pattern = self._get_nested('naming', 'pattern')
         
         if not has_rules and not has_pattern:
             raise ConfigError(self.messages.t('config.missing_field', field='naming.rules 或 naming.pattern'))
         
-        if not self._get_nested('git.repository'):
+        if not self._get_nested('git', 'repository'):
             raise ConfigError(self.messages.t('config.missing_field', field='git.repository'))
         
         if 'asset_root' not in self.data:
@@ -47,8 +60,7 @@ class Config:
         if not has_rules and 'path_template' not in self.data:
             raise ConfigError(self.messages.t('config.missing_field', field='path_template'))
     
-    def _get_nested(self, key_path: str) -> Any:
-        keys = key_path.split('.')
+    def _get_nested(self, *keys: str) -> Any:
         value = self.data
         for key in keys:
             if isinstance(value, dict):
@@ -89,21 +101,21 @@ class Config:
     def path_template(self) -> str:
         return self.data.get('path_template', '')
     
-    @property
+    @cached_property
     def naming_rules(self) -> list[dict]:
-        rules = self._get_nested('naming.rules')
+        rules = self._get_nested('naming', 'rules')
         if rules:
             return rules
-        pattern = self._get_nested('naming.pattern')
+        pattern = self._get_nested('naming', 'pattern')
         if pattern:
             return [{
                 'pattern': pattern,
                 'path_template': self.path_template,
-                'example': self._get_nested('naming.example') or ''
+                'example': self._get_nested('naming', 'example') or ''
             }]
         return []
     
-    @property
+    @cached_property
     def naming_examples(self) -> list[str]:
         return [r.get('example', '') for r in self.naming_rules if r.get('example')]
     
@@ -123,7 +135,7 @@ class Config:
             raise ConfigError(temp_messages.t('config.file_not_found', path=str(config_file)))
         
         try:
-            data = yaml.safe_load(config_file.read_text(encoding='utf-8'))
+            data = yaml.load(config_file.read_text(encoding='utf-8'), Loader=SafeLoader)
         except yaml.YAMLError as e:
             raise ConfigError(temp_messages.t('config.invalid_yaml', error=str(e)))
         
@@ -136,14 +148,15 @@ class Config:
         if not template_path.exists():
             raise ConfigError(f"配置模板不存在: {template_path}")
         
-        content = template_path.read_text(encoding='utf-8').replace(
-            'asset_root: "Assets/GameRes/"', f'asset_root: "{asset_root}"'
-        ).replace(
-            'repository: "https://your-git-host.com/your-org/your-project.git"', f'repository: "{git_url}"'
+        values = {'asset_root': asset_root, 'repository': git_url}
+        content = _TEMPLATE_PLACEHOLDERS.sub(
+            lambda m: f'{m.group(1)}: "{values[m.group(1)]}"',
+            template_path.read_text(encoding='utf-8')
         )
         
         if output_file is None:
-            project_name = git_url.rstrip('/').split('/')[-1].replace('.git', '')
+            match = _GIT_REPO_NAME.search(git_url)
+            project_name = match.group(1) if match else 'config'
             output_file = Path(f"{project_name}.yaml")
         
         output_file.write_text(content, encoding='utf-8')
@@ -11,11 +11,21 @@ from .i18n import Messages
 class GitRepo:
     def __init__(self, repo_path: Path, messages: Messages = None, token: str = None):
         self.repo_path = repo_path
+        self._repo_prefix = os.path.join(os.fspath(repo_path), '')
+        self._exists = False
         self.messages = messages or Messages()
         self.token = token or os.getenv('GIT_TOKEN') or os.getenv('GITHUB_TOKEN')
     
-    def exists(self) -> bool:
-        return (self.repo_path / ".git").exists()
+    def exists(self, refresh: bool = False) -> bool:
+        if refresh or not self._exists:
+            self._exists = (self.repo_path / ".git").exists()
+        return self._exists
+    
+    def _rel_path(self, file_path: Path) -> str:
+        path = os.fspath(file_path)
+        if not path.startswith(self._repo_prefix):
+            raise GitError(self.messages.t('git.file_not_in_repo', path=file_path))
+        return path[len(self._repo_prefix):]
     
     def _inject_token(self, git_url: str) -> str:
         if not self.token:
@@ -34,7 +44,7 @@ class GitRepo:
     def clone(self, git_url: str, branch: str = "main", 
               user_name: str = "Asset Handoffer", 
               user_email: str = "asset-handoffer@local"):
-        if self.exists():
+        if self.exists(refresh=True):
             raise GitError(self.messages.t('git.repo_exists', path=self.repo_path))
         
         url_with_token = self._inject_token(git_url)
@@ -46,6 +56,7 @@ class GitRepo:
                  '-c', 'credential.helper=', url_with_token, str(self.repo_path)],
                 check=True, capture_output=True, text=True, env=env
             )
+            self._exists = True
             
             if self.token:
                 subprocess.run(['git', 'config', 'credential.helper', ''],
@@ -62,51 +73,108 @@ class GitRepo:
     
     def pull(self):
         try:
-            subprocess.run(['git', 'pull'], cwd=str(self.repo_path),
-                check=True, capture_output=True, text=True, env=self._get_git_env())
+            self._run_git(['pull'])
         except subprocess.CalledProcessError as e:
             raise GitError(self.messages.t('git.pull_failed_new', error=e.stderr))
     
     def add(self, file_path: Path):
+        rel_path = self._rel_path(file_path)
         try:
-            rel_path = file_path.relative_to(self.repo_path)
-            self._run_git(['add', str(rel_path)])
-        except ValueError:
-            raise GitError(self.messages.t('git.file_not_in_repo', path=file_path))
+            self._run_git(['add', rel_path])
+        except subprocess.CalledProcessError as e:
+            raise GitError(self.messages.t('git.add_failed', error=e.stderr))
+    
+    def add_many(self, file_paths: list[Path]):
+        rel_paths = [self._rel_path(file_path) for file_path in file_paths]
+        
+        try:
+            self._run_git(['--literal-pathspecs', 'add', '--pathspec-from-file=-', '--pathspec-file-nul'],
+                          input='\0'.join(rel_paths))
         except subprocess.CalledProcessError as e:
             raise GitError(self.messages.t('git.add_failed', error=e.stderr))
     
     def commit(self, message: str):
         try:
-            self._run_git(['commit', '-m', message])
+            self._run_git(['commit', '-m', message], decode=True)
         except subprocess.CalledProcessError as e:
-            if "nothing to commit" not in e.stderr:
+            if "nothing to commit" not in e.stdout + e.stderr:
                 raise GitError(self.messages.t('git.commit_failed', error=e.stderr))
     
     def push(self, branch: Optional[str] = None):
         try:
-            cmd = ['git', 'push'] + (['origin', branch] if branch else [])
-            subprocess.run(cmd, cwd=str(self.repo_path),
-                check=True, capture_output=True, text=True, env=self._get_git_env())
+            self._run_git(['push'] + (['origin', branch] if branch else []))
         except subprocess.CalledProcessError as e:
             raise GitError(self.messages.t('git.push_failed_new', error=e.stderr))
     
+    def head(self) -> Optional[str]:
+        try:
+            return self._run_git(['rev-parse', '--verify', '-q', 'HEAD'], decode=True).stdout.strip()
+        except subprocess.CalledProcessError:
+            return None
+    
+    def check_ignore(self, file_paths: list[Path]) -> set[Path]:
+        rel_paths = [self._rel_path(file_path) for file_path in file_paths]
+        
+        try:
+            result = self._run_git(['check-ignore', '--stdin', '-z'], input='\0'.join(rel_paths), decode=True)
+        except subprocess.CalledProcessError as e:
+            if e.returncode == 1:
+                return set()
+            raise GitError(self.messages.t('git.check_ignore_failed', error=e.stderr))
+        return {self.repo_path / p for p in result.stdout.split('\0') if p}
+    
+    def rollback(self, head: Optional[str], file_paths: list[Path]):
+        rel_paths = [self._rel_path(file_path) for file_path in file_paths]
+        
+        try:
+            if self.head() != head:
+                self._run_git(['reset', '-q', '--soft', head] if head else ['update-ref', '-d', 'HEAD'])
+            self._run_git(['--literal-pathspecs', 'reset', '-q', '--pathspec-from-file=-', '--pathspec-file-nul'],
+                          input='\0'.join(rel_paths))
+        except subprocess.CalledProcessError as e:
+            raise GitError(self.messages.t('git.reset_failed', error=e.stderr))
+    
     def remove(self, file_path: Path):
+        rel_path = self._rel_path(file_path)
         try:
-            rel_path = file_path.relative_to(self.repo_path)
-            self._run_git(['rm', str(rel_path)])
-        except ValueError:
-            raise GitError(self.messages.t('git.file_not_in_repo', path=file_path))
+            self._run_git(['rm', rel_path])
         except subprocess.CalledProcessError as e:
-            raise GitError(self.messages.t('git.push_failed_new', error=e.stderr))
+            raise GitError(self.messages.t('git.rm_failed', error=e.stderr))
+    
+    def remove_many(self, file_paths: list[Path]):
+        rel_paths = [self._rel_path(file_path) for file_path in file_paths]
+        
+        try:
+            self._run_git(['--literal-pathspecs', 'rm', '--quiet', '--pathspec-from-file=-', '--pathspec-file-nul'],
+                          input='\0'.join(rel_paths))
+        except subprocess.CalledProcessError as e:
+            raise GitError(self.messages.t('git.rm_failed', error=e.stderr))
+    
+    def ls_files(self, pattern: str) -> list[Path]:
+        try:
+            result = self._run_git(['ls-files', '-z', '--', f':(glob)**/{pattern}'], decode=True)
+        except subprocess.CalledProcessError as e:
+            raise GitError(self.messages.t('git.ls_files_failed', error=e.stderr))
+        return [self.repo_path / p for p in result.stdout.split('\0') if p]
     
     def _get_git_env(self):
         env = os.environ.copy()
+        env['LC_ALL'] = 'C'
+        env['GIT_OPTIONAL_LOCKS'] = '0'
         if self.token:
             env['GIT_TERMINAL_PROMPT'] = '0'
             env['GCM_INTERACTIVE'] = 'never'
         return env
     
-    def _run_git(self, args: list) -> subprocess.CompletedProcess:
-        return subprocess.run(['git'] + args, cwd=str(self.repo_path),
-            check=True, capture_output=True, text=True)
+    def _run_git(self, args: list, input: Optional[str] = None, decode: bool = False) -> subprocess.CompletedProcess:
+        result = subprocess.run(['git'] + args, cwd=str(self.repo_path),
+            input=input.encode('utf-8') if input is not None else None,
+            stdout=subprocess.PIPE if decode else subprocess.DEVNULL, stderr=subprocess.PIPE,
+            env=self._get_git_env())
+        
+        stdout = result.stdout.decode('utf-8', 'replace') if decode else ''
+        if result.returncode != 0:
+            raise subprocess.CalledProcessError(result.returncode, result.args, stdout,
+                                                result.stderr.decode('utf-8', 'replace'))
+        result.stdout = stdout
+        return result
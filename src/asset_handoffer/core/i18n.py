@@ -1,21 +1,28 @@
+from functools import lru_cache
 from importlib import resources
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+
+@lru_cache(maxsize=8)
+def _load_messages(language: str) -> dict[str, str]:
+    for pkg in ["asset_handoffer.core", "asset_handoffer"]:
+        try:
+            src = resources.files(pkg).joinpath("locales") / f"{language}.yaml"
+            return yaml.load(src.read_text(encoding="utf-8"), Loader=SafeLoader) or {}
+        except Exception:
+            continue
+    return {}
+
 
 class Messages:
     def __init__(self, language: str = "zh-CN"):
         self.language = language
-        self.messages: dict[str, str] = {}
-        
-        for pkg in ["asset_handoffer.core", "asset_handoffer"]:
-            try:
-                base = resources.files(pkg).joinpath("locales")
-                with resources.as_file(base / f"{language}.yaml") as src:
-                    with open(src, "r", encoding="utf-8") as f:
-                        self.messages = yaml.safe_load(f) or {}
-                        return
-            except Exception:
-                continue
+        self.messages: dict[str, str] = _load_messages(language)
     
     def t(self, key: str, **kwargs) -> str:
         s = self.messages.get(key, key)
@@ -1,9 +1,18 @@
 import re
 from dataclasses import dataclass
-from typing import Pattern
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Callable, Mapping, Match, Optional, Pattern
 from .exceptions import ParseError
 from .i18n import Messages
 
+_PARSE_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=64)
+def _compile_pattern(pattern: str) -> Pattern:
+    return re.compile(pattern)
+
 
 @dataclass
 class NamingRule:
@@ -12,17 +21,19 @@ class NamingRule:
     example: str = ""
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ParsedFilename:
     original_name: str
-    groups: dict[str, str]
+    groups: Mapping[str, str]
     path_template: str = ""
 
 
 class FilenameParser:
-    def __init__(self, pattern: str = None, messages: Messages = None, *, rules: list[dict] = None):
+    def __init__(self, pattern: str | Pattern = None, messages: Messages = None, *, rules: list[dict] = None):
         self.messages = messages or Messages()
         self.rules: list[NamingRule] = []
+        self._matchers: list[tuple[Callable[[str], Optional[Match]], NamingRule]] = []
+        self._parse_cache: dict[str, ParsedFilename] = {}
         
         if rules:
             for rule in rules:
@@ -30,29 +41,45 @@ class FilenameParser:
         elif pattern:
             self._add_rule(pattern, '', '')
     
-    def _add_rule(self, pattern: str, path_template: str, example: str):
+    def _add_rule(self, pattern: str | Pattern, path_template: str, example: str):
         try:
-            compiled = re.compile(pattern)
+            compiled = pattern if isinstance(pattern, re.Pattern) else _compile_pattern(pattern)
         except re.error as e:
             raise ParseError(self.messages.t('parse.invalid_pattern', error=str(e)))
         
         if not ('ext' in compiled.groupindex or 'extension' in compiled.groupindex):
             raise ParseError(self.messages.t('parse.missing_ext_group'))
         
-        self.rules.append(NamingRule(pattern=compiled, path_template=path_template, example=example))
+        rule = NamingRule(pattern=compiled, path_template=path_template, example=example)
+        self.rules.append(rule)
+        self._matchers.append((compiled.match, rule))
+        self._parse_cache.clear()
     
     def parse(self, filename: str) -> ParsedFilename:
-        for rule in self.rules:
-            match = rule.pattern.match(filename)
+        result = self._parse_cache.get(filename)
+        if result is None:
+            result = self.try_parse(filename)
+            if result is None:
+                raise self._no_match_error(filename)
+            if len(self._parse_cache) >= _PARSE_CACHE_SIZE:
+                self._parse_cache.clear()
+            self._parse_cache[filename] = result
+        return result
+    
+    def try_parse(self, filename: str) -> Optional[ParsedFilename]:
+        for match_fn, rule in self._matchers:
+            match = match_fn(filename)
             if match:
                 return ParsedFilename(
                     original_name=filename,
-                    groups=match.groupdict(),
+                    groups=MappingProxyType(match.groupdict()),
                     path_template=rule.path_template
                 )
-        
+        return None
+    
+    def _no_match_error(self, filename: str) -> ParseError:
         examples = [r.example for r in self.rules if r.example]
         msg = self.messages.t('parse.filename_not_match', filename=filename)
         if examples:
             msg += "\n" + self.messages.t('parse.examples', examples=', '.join(examples))
-        raise ParseError(msg)
+        return ParseError(msg)
@@ -9,12 +9,19 @@ class PathGenerator:
         self.default_template = default_template
         self.asset_root = asset_root
         self.messages = messages or Messages()
+        self._roots: dict[Path, Path] = {}
+    
+    def _root(self, repo_base: Path) -> Path:
+        root = self._roots.get(repo_base)
+        if root is None:
+            root = self._roots[repo_base] = repo_base / self.asset_root
+        return root
     
     def generate(self, parsed: ParsedResult, repo_base: Path) -> Path:
         template = parsed.path_template if parsed.path_template else self.default_template
         
         try:
-            rel_path = template.format(**parsed.groups)
+            rel_path = template.format_map(parsed.groups)
         except KeyError as e:
             raise ProcessError(self.messages.t(
                 'process.template_undefined_field',
@@ -22,11 +29,8 @@ class PathGenerator:
                 available=', '.join(parsed.groups.keys())
             ))
         
-        full_path = repo_base / self.asset_root / rel_path
+        full_path = self._root(repo_base) / rel_path
         
         if rel_path.endswith(('.', '/')):
-            full_path.mkdir(parents=True, exist_ok=True)
             return full_path / parsed.original_name
-        
-        full_path.parent.mkdir(parents=True, exist_ok=True)
         return full_path
@@ -1,4 +1,7 @@
+import errno
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, Callable
@@ -11,6 +14,17 @@ from .path_generator import PathGenerator as DefaultPathGenerator
 from .protocols import IParser, IPathGenerator
 from .exceptions import GitError, ProcessError, ParseError
 
+_MAX_WORKERS = min(8, os.cpu_count() or 1)
+
+
+def _move(src: Path, dst: Path):
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(str(src), str(dst))
+
 
 @dataclass
 class ProcessResult:
@@ -27,65 +41,157 @@ class FileProcessor:
         *,
         parser: Optional[IParser] = None,
         path_generator: Optional[IPathGenerator] = None,
-        on_message: Optional[Callable[[str], None]] = None
+        on_message: Optional[Callable[[str], None]] = None,
+        quiet: bool = False
     ):
         self.config = config
         self.messages = config.messages
         self._output = on_message or print
+        self.quiet = quiet
         
         self.parser = parser or FilenameParser(rules=config.naming_rules, messages=self.messages)
         self.path_gen = path_generator or DefaultPathGenerator(
             config.path_template, config.asset_root, self.messages
         )
         self.repo = GitRepo(config.repo, self.messages, config.git_token)
+        self._commit_template = config.git_commit_template
+        self._made_dirs: set[Path] = set()
     
     def process(self, file_path: Path) -> ProcessResult:
-        try:
-            if not self.repo.exists():
-                raise ProcessError(self.messages.t('process.repo_not_exists'))
-            
+        return self._process_files([file_path])[0]
+    
+    def _process_files(self, files: list[Path], show_progress: bool = False) -> list[ProcessResult]:
+        if not files:
+            return []
+        
+        if not self.repo.exists():
+            error = ProcessError(self.messages.t('process.repo_not_exists'))
+            return [self._fail(file_path, error) for file_path in files]
+        
+        self._made_dirs.clear()
+        results: list[Optional[ProcessResult]] = [None] * len(files)
+        planned: list[tuple[int, Path, str]] = []
+        claimed: dict[Path, str] = {}
+        
+        for i, file_path in enumerate(files):
+            if show_progress and not self.quiet:
+                self._output(self.messages.t('process.processing',
+                                    current=i + 1, total=len(files), filename=file_path.name))
             try:
-                parsed = self.parser.parse(file_path.name)
-            except ParseError as e:
-                raise ProcessError(
-                    self.messages.t('process.filename_error',
-                                  error=str(e),
-                                  example=self.config.naming_example)
-                )
-            
-            target_path = self.path_gen.generate(parsed, self.config.repo)
-            target_path.parent.mkdir(parents=True, exist_ok=True)
-            shutil.move(str(file_path), str(target_path))
+                target_path, commit_msg = self._plan(file_path)
+                if target_path in claimed:
+                    raise ProcessError(self.messages.t('process.duplicate_target',
+                                        path=target_path.relative_to(self.config.repo),
+                                        other=claimed[target_path]))
+                claimed[target_path] = file_path.name
+            except Exception as e:
+                results[i] = self._fail(file_path, e)
+                continue
+            planned.append((i, target_path, commit_msg))
+        
+        if not planned:
+            return results
+        
+        try:
+            self.repo.pull()
+            base = self.repo.head()
+            ignored = self.repo.check_ignore([target_path for _, target_path, _ in planned])
+        except GitError as e:
+            self._output(self.messages.t('process.git_failed', error=str(e)))
+            for i, _, _ in planned:
+                self._output(self.messages.t('process.not_processed', filename=files[i].name))
+                results[i] = ProcessResult(success=False, source_path=files[i], error=str(e))
+            return results
+        
+        if ignored:
+            for i, target_path, _ in planned:
+                if target_path in ignored:
+                    results[i] = self._fail(files[i], GitError(self.messages.t(
+                        'git.file_ignored', path=target_path.relative_to(self.config.repo))))
+            planned = [p for p in planned if p[1] not in ignored]
+            if not planned:
+                return results
+        
+        placed: list[tuple[int, Path, str]] = []
+        
+        with ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(planned))) as pool:
+            futures = [pool.submit(self._place, files[i], target_path) for i, target_path, _ in planned]
             
+            for (i, target_path, commit_msg), future in zip(planned, futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    results[i] = self._fail(files[i], e)
+                    continue
+                placed.append((i, target_path, commit_msg))
+        
+        if not placed:
+            return results
+        
+        try:
+            self.repo.add_many([target_path for _, target_path, _ in placed])
+            self.repo.commit(self._batch_commit_message([msg for _, _, msg in placed]))
+            self.repo.push()
+        except GitError as e:
+            self._output(self.messages.t('process.git_failed', error=str(e)))
             try:
-                self.repo.pull()
-                self.repo.add(target_path)
-                commit_msg = self.config.git_commit_template.format(**parsed.groups)
-                self.repo.commit(commit_msg)
-                self.repo.push()
-            except GitError as e:
-                self._handle_git_failure(target_path, file_path, e)
-                return ProcessResult(success=False, source_path=file_path, error=str(e))
-            
-            self._output(self.messages.t('process.success', filename=file_path.name))
-            self._output(self.messages.t('process.target', path=target_path.relative_to(self.config.repo)))
-            return ProcessResult(success=True, source_path=file_path, target_path=target_path)
-            
-        except Exception as e:
-            self._output(self.messages.t('process.unknown_error', error=str(e)))
-            self._move_to_failed(file_path)
-            return ProcessResult(success=False, source_path=file_path, error=str(e))
+                self.repo.rollback(base, [target_path for _, target_path, _ in placed])
+            except GitError as rollback_error:
+                self._output(self.messages.t('process.git_failed', error=str(rollback_error)))
+            for i, target_path, _ in placed:
+                self._restore(target_path, files[i])
+                results[i] = ProcessResult(success=False, source_path=files[i], error=str(e))
+            return results
+        
+        for i, target_path, _ in placed:
+            if not self.quiet:
+                self._output(self.messages.t('process.success', filename=files[i].name))
+                self._output(self.messages.t('process.target', path=target_path.relative_to(self.config.repo)))
+            results[i] = ProcessResult(success=True, source_path=files[i], target_path=target_path)
+        return results
+    
+    def _batch_commit_message(self, messages: list[str]) -> str:
+        if len(messages) == 1:
+            return messages[0]
+        subject = self.messages.t('git.batch_commit_message', count=len(messages))
+        return subject + '\n\n' + '\n'.join(dict.fromkeys(messages))
+    
+    def _plan(self, file_path: Path) -> tuple[Path, str]:
+        try:
+            parsed = self.parser.parse(file_path.name)
+        except ParseError as e:
+            raise ProcessError(
+                self.messages.t('process.filename_error',
+                              error=str(e),
+                              example=', '.join(self.config.naming_examples))
+            )
+        
+        commit_msg = self._commit_template.format_map(parsed.groups)
+        return self.path_gen.generate(parsed, self.config.repo), commit_msg
+    
+    def _place(self, file_path: Path, target_path: Path):
+        parent = target_path.parent
+        if parent not in self._made_dirs:
+            parent.mkdir(parents=True, exist_ok=True)
+            self._made_dirs.add(parent)
+        _move(file_path, target_path)
+    
+    def _fail(self, file_path: Path, error: Exception) -> ProcessResult:
+        self._output(self.messages.t('process.file_failed', filename=file_path.name))
+        self._output(self.messages.t('process.unknown_error', error=str(error)))
+        self._move_to_failed(file_path)
+        return ProcessResult(success=False, source_path=file_path, error=str(error))
     
-    def _handle_git_failure(self, target_path: Path, original_path: Path, error: GitError):
+    def _restore(self, target_path: Path, original_path: Path):
         try:
             if original_path.parent.exists():
-                shutil.move(str(target_path), str(original_path))
-                self._output(self.messages.t('process.git_failed_moved_back', error=str(error)))
+                _move(target_path, original_path)
+                self._output(self.messages.t('process.moved_back', filename=original_path.name))
             else:
                 self._move_to_failed(target_path)
-                self._output(self.messages.t('process.git_failed', error=str(error)))
         except Exception as e:
-            self._output(self.messages.t('process.file_recovery_failed', error=str(e)))
+            self._output(self.messages.t('process.file_recovery_failed',
+                                         filename=original_path.name, error=str(e)))
     
     def _move_to_failed(self, file_path: Path):
         try:
@@ -96,21 +202,12 @@ class FileProcessor:
                 failed_path = self.config.failed / f"{file_path.stem}_{datetime.now():%Y%m%d_%H%M%S}{file_path.suffix}"
             
             if file_path.exists():
-                shutil.move(str(file_path), str(failed_path))
+                _move(file_path, failed_path)
             self._output(self.messages.t('process.move_to_failed', path=failed_path))
         except Exception as e:
             self._output(self.messages.t('process.move_to_failed_error', error=str(e)))
     
     def process_batch(self, files: list[Path]) -> tuple[int, int]:
-        success = failed = 0
-        
-        for i, file_path in enumerate(files, 1):
-            self._output(self.messages.t('process.processing',
-                                current=i, total=len(files), filename=file_path.name))
-            
-            if self.process(file_path).success:
-                success += 1
-            else:
-                failed += 1
-        
-        return success, failed
+        results = self._process_files(files, show_progress=True)
+        success = sum(1 for r in results if r.success)
+        return success, len(results) - success
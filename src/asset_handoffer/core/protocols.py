@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Protocol
+from typing import Mapping, Protocol
 
 
 class ParsedResult(Protocol):
@@ -7,7 +7,7 @@ class ParsedResult(Protocol):
     def original_name(self) -> str: ...
     
     @property
-    def groups(self) -> dict[str, str]: ...
+    def groups(self) -> Mapping[str, str]: ...
     
     @property
     def path_template(self) -> str: ...
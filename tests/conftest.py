@@ -0,0 +1,37 @@
+import subprocess
+import pytest
+from asset_handoffer.core import Config, GitRepo
+
+
+def git(*args, cwd):
+    return subprocess.run(['git', *args], cwd=cwd, check=True, capture_output=True, text=True).stdout
+
+
+@pytest.fixture
+def config(tmp_path):
+    remote = tmp_path / "remote.git"
+    git('init', '--bare', '-b', 'main', str(remote), cwd=tmp_path)
+    
+    seed = tmp_path / "seed"
+    git('clone', str(remote), str(seed), cwd=tmp_path)
+    (seed / "README.md").write_text("seed")
+    git('add', 'README.md', cwd=seed)
+    git('-c', 'user.name=Seed', '-c', 'user.email=seed@local', 'commit', '-m', 'Initial', cwd=seed)
+    git('push', 'origin', 'HEAD:main', cwd=seed)
+    
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(f'''workspace: "./workspace"
+git:
+  repository: "{remote.as_posix()}"
+  commit_message: "Update {{type}}: {{name}}"
+asset_root: "Assets/"
+path_template: "{{type}}/{{name}}.{{ext}}"
+naming:
+  pattern: "^(?P<type>[^_]+)_(?P<name>[^_]+)(_(?P<variant>[^.]+))?\\\\.(?P<ext>\\\\w+)$"
+  example: "Character_Hero.fbx"
+''')
+    
+    config = Config.load(config_file)
+    config.ensure_dirs()
+    GitRepo(config.repo).clone(config.git_url, config.git_branch)
+    return config
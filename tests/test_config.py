@@ -34,3 +34,23 @@ language: "zh-CN"
     config = Config.load(config_file)
     assert config.inbox == tmp_path / "inbox"
     assert config.repo == tmp_path / ".repo"
+
+
+def test_create_fills_asset_root(tmp_path):
+    config_file = tmp_path / "test_config.yaml"
+    
+    Config.create(
+        git_url="https://github.com/test/test.git",
+        asset_root="Assets/Art/",
+        output_file=config_file
+    )
+    
+    config = Config.load(config_file)
+    assert config.asset_root == "Assets/Art/"
+
+
+def test_create_default_output_name(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    
+    assert Config.create(git_url="https://github.com/test/my.github-repo.git") == Path("my.github-repo.yaml")
+    assert Config.create(git_url="git@gitee.com:team/game.git") == Path("game.yaml")
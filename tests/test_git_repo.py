@@ -0,0 +1,48 @@
+import pytest
+from asset_handoffer.core import GitRepo
+from conftest import git
+
+
+@pytest.fixture
+def repo(config):
+    for rel_path in ["Assets/Prop/Box.fbx", "Assets/Prop/Box.png", "Assets/Character/Box.fbx",
+                     "Assets/UI/[x].fbx", "Assets/UI/x.fbx"]:
+        path = config.repo / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(rel_path)
+    git('add', '.', cwd=config.repo)
+    git('commit', '-m', 'Add assets', cwd=config.repo)
+    return GitRepo(config.repo)
+
+
+def rel_paths(repo, paths):
+    return sorted(p.relative_to(repo.repo_path).as_posix() for p in paths)
+
+
+def test_ls_files_top_level_name(repo):
+    assert rel_paths(repo, repo.ls_files("README.md")) == ["README.md"]
+
+
+def test_ls_files_matches_any_depth(repo):
+    assert rel_paths(repo, repo.ls_files("Box*")) == [
+        "Assets/Character/Box.fbx", "Assets/Prop/Box.fbx", "Assets/Prop/Box.png"
+    ]
+
+
+def test_ls_files_subdirectory_glob(repo):
+    assert rel_paths(repo, repo.ls_files("Prop/*.fbx")) == ["Assets/Prop/Box.fbx"]
+
+
+def test_ls_files_not_found(repo):
+    assert repo.ls_files("*.wav") == []
+
+
+def test_remove_many_treats_paths_literally(repo):
+    matches = repo.ls_files("*x].fbx")
+    assert rel_paths(repo, matches) == ["Assets/UI/[x].fbx"]
+    
+    repo.remove_many(matches)
+    
+    assert not (repo.repo_path / "Assets/UI/[x].fbx").exists()
+    assert (repo.repo_path / "Assets/UI/x.fbx").exists()
+    assert git('status', '--porcelain', '-z', cwd=repo.repo_path) == "D  Assets/UI/[x].fbx\0"
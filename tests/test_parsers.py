@@ -1,3 +1,4 @@
+import re
 import pytest
 from asset_handoffer.core import FilenameParser, ParseError
 
@@ -68,3 +69,27 @@ def test_multi_rule_two_layer(multi_rule_parser):
 def test_no_match_raises_error(multi_rule_parser):
     with pytest.raises(ParseError):
         multi_rule_parser.parse("Invalid.fbx")
+
+
+def test_parse_reuses_result(single_rule_parser):
+    result = single_rule_parser.parse("GameCore_Character_Hero_Idle.fbx")
+    assert single_rule_parser.parse("GameCore_Character_Hero_Idle.fbx") is result
+
+
+def test_precompiled_pattern():
+    pattern = re.compile(r"^(?P<category>[^_]+)_(?P<name>[^_]+)\.(?P<ext>\w+)$")
+    parser = FilenameParser(rules=[{'pattern': pattern, 'path_template': "{category}/{name}.{ext}"}])
+    assert parser.rules[0].pattern is pattern
+    assert parser.parse("Audio_Ambient.wav").groups["name"] == "Ambient"
+
+
+def test_try_parse(multi_rule_parser):
+    assert multi_rule_parser.try_parse("Invalid.fbx") is None
+    assert multi_rule_parser.try_parse("Audio_Ambient.wav").groups["category"] == "Audio"
+
+
+def test_cached_groups_are_read_only(single_rule_parser):
+    result = single_rule_parser.parse("GameCore_Character_Hero_Idle.fbx")
+    with pytest.raises(TypeError):
+        result.groups["module"] = "Other"
+    assert single_rule_parser.parse("GameCore_Character_Hero_Idle.fbx").groups["module"] == "GameCore"
@@ -0,0 +1,98 @@
+from asset_handoffer.core import FileProcessor
+from conftest import git
+
+
+def remote_path(config):
+    return config.workspace_root.parent / "remote.git"
+
+
+def add_inbox_files(config, *names):
+    files = []
+    for name in names:
+        path = config.inbox / name
+        path.write_text(name)
+        files.append(path)
+    return files
+
+
+def test_batch_makes_one_commit(config):
+    files = add_inbox_files(config, "Character_Hero.fbx", "Prop_Box.fbx")
+    
+    assert FileProcessor(config, on_message=lambda _: None).process_batch(files) == (2, 0)
+    
+    remote = remote_path(config)
+    assert git('rev-list', '--count', 'main', cwd=remote).strip() == "2"
+    assert git('ls-tree', '-r', '--name-only', 'main', cwd=remote).split() == [
+        "Assets/Character/Hero.fbx", "Assets/Prop/Box.fbx", "README.md"
+    ]
+    assert git('log', '-1', '--format=%b', 'main', cwd=remote).split('\n')[:2] == [
+        "Update Character: Hero", "Update Prop: Box"
+    ]
+
+
+def test_unparsable_file_goes_to_failed(config):
+    files = add_inbox_files(config, "Invalid.fbx", "Prop_Box.fbx")
+    
+    assert FileProcessor(config, on_message=lambda _: None).process_batch(files) == (1, 1)
+    assert (config.failed / "Invalid.fbx").exists()
+    assert not (config.inbox / "Invalid.fbx").exists()
+
+
+def test_rejected_push_moves_files_back(config):
+    hook = remote_path(config) / "hooks" / "pre-receive"
+    hook.write_text("#!/bin/sh\nexit 1\n")
+    hook.chmod(0o755)
+    files = add_inbox_files(config, "Character_Hero.fbx", "Prop_Box.fbx")
+    
+    assert FileProcessor(config, on_message=lambda _: None).process_batch(files) == (0, 2)
+    assert all(f.exists() for f in files)
+    assert not (config.repo / "Assets" / "Prop" / "Box.fbx").exists()
+
+
+def test_no_pull_when_nothing_parses(config, monkeypatch):
+    processor = FileProcessor(config, on_message=lambda _: None)
+    pulls = []
+    monkeypatch.setattr(processor.repo, 'pull', lambda: pulls.append(True))
+    files = add_inbox_files(config, "Invalid.fbx")
+    
+    assert processor.process_batch(files) == (0, 1)
+    assert pulls == []
+
+
+def test_duplicate_target_fails_later_file(config):
+    files = add_inbox_files(config, "Character_Hero.fbx", "Character_Hero_v2.fbx")
+    
+    assert FileProcessor(config, on_message=lambda _: None).process_batch(files) == (1, 1)
+    assert (config.repo / "Assets" / "Character" / "Hero.fbx").read_text() == "Character_Hero.fbx"
+    assert (config.failed / "Character_Hero_v2.fbx").exists()
+
+
+def test_ignored_file_fails_alone(config):
+    seed = config.workspace_root.parent / "seed"
+    (seed / ".gitignore").write_text("*.psd\n")
+    git('add', '.gitignore', cwd=seed)
+    git('-c', 'user.name=Seed', '-c', 'user.email=seed@local', 'commit', '-m', 'Ignore psd', cwd=seed)
+    git('push', 'origin', 'HEAD:main', cwd=seed)
+    files = add_inbox_files(config, "Character_Hero.fbx", "Prop_Box.psd", "Prop_Crate.fbx")
+    
+    assert FileProcessor(config, on_message=lambda _: None).process_batch(files) == (2, 1)
+    assert (config.failed / "Prop_Box.psd").exists()
+    assert git('ls-tree', '-r', '--name-only', 'main', cwd=remote_path(config)).split() == [
+        ".gitignore", "Assets/Character/Hero.fbx", "Assets/Prop/Crate.fbx", "README.md"
+    ]
+
+
+def test_rejected_push_is_not_published_by_next_batch(config):
+    hook = remote_path(config) / "hooks" / "pre-receive"
+    hook.write_text("#!/bin/sh\nexit 1\n")
+    hook.chmod(0o755)
+    processor = FileProcessor(config, on_message=lambda _: None)
+    
+    assert processor.process_batch(add_inbox_files(config, "Character_Hero.fbx", "Prop_Crate.fbx")) == (0, 2)
+    assert git('status', '--porcelain', cwd=config.repo) == ""
+    
+    hook.unlink()
+    assert processor.process_batch(add_inbox_files(config, "Prop_Lamp.fbx")) == (1, 0)
+    assert git('ls-tree', '-r', '--name-only', 'main', cwd=remote_path(config)).split() == [
+        "Assets/Prop/Lamp.fbx", "README.md"
+    ]